@@ -6,10 +6,133 @@ Analyzes the Flutter project structure and dependencies
 
 import os
 import re
+import json
 import yaml
 from pathlib import Path
 from typing import Dict, List
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+_IMPORT_RE = re.compile(r"import\s+['\"]([^'\"]+)['\"];")
+
+# `key: value` line as pubspecs write them; anything else goes to the YAML parser
+_PUBSPEC_LINE_RE = re.compile(r'^( *)([A-Za-z0-9_.-]+) *:(?: +(.*?))? *$')
+_PUBSPEC_SCALARS = ('name', 'version')
+_PUBSPEC_SECTIONS = ('environment', 'dependencies', 'dev_dependencies')
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+
+# Tooling, VCS and build output directories never hold project sources
+_SKIP_DIRS = {'.git', '.dart_tool', 'build', 'node_modules', '.idea', '.vscode', 'ios/Pods'}
+
+def _pubspec_scalar(value):
+    """String value of a pubspec scalar, or None when YAML would not read it as a plain string"""
+    if value is None or '\t' in value:
+        return None
+    if len(value) >= 2 and value[0] == value[-1] == "'" and "'" not in value[1:-1]:
+        return value[1:-1]
+    if len(value) >= 2 and value[0] == value[-1] == '"' and '"' not in value[1:-1] and '\\' not in value:
+        return value[1:-1]
+    if value[0] in '\'"[]{}&*!|>%@`,?-:#' or ': ' in value:
+        return None
+    # Plain scalars like 1.0 or true resolve to other types; only keep the ones YAML reads as strings
+    if yaml.resolver.Resolver().resolve(yaml.ScalarNode, value, (True, False)) != _YAML_STR_TAG:
+        return None
+    return value
+
+def _parse_pubspec_fast(text: str):
+    """Read only the pubspec keys analyze_pubspec uses, line by line; None when the file needs a real YAML parser"""
+    pubspec = {}
+    top_key = None
+    section = None
+    child_indent = None
+    
+    for raw_line in text.splitlines():
+        stripped = raw_line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+            
+        indent = len(raw_line) - len(raw_line.lstrip(' '))
+        if indent:
+            if section is None:
+                # A scalar continued onto the next line needs YAML folding; anything else is under a key we skip
+                if top_key in _PUBSPEC_SCALARS:
+                    return None
+                continue
+            if child_indent is None:
+                child_indent = indent
+                pubspec[section] = {}
+            if indent > child_indent:
+                # Package sources (sdk:, git:, path:) are irrelevant; environment values are never nested
+                if section == 'environment':
+                    return None
+                continue
+            if indent < child_indent:
+                return None
+                
+        if '#' in raw_line:
+            if "'" in raw_line or '"' in raw_line:
+                return None
+            raw_line = raw_line.split(' #', 1)[0]
+        match = _PUBSPEC_LINE_RE.match(raw_line)
+        if not match:
+            return None
+        key, value = match.group(2), match.group(3)
+        
+        if indent == 0:
+            top_key = key
+            section = None
+            if key in _PUBSPEC_SCALARS:
+                pubspec[key] = _pubspec_scalar(value)
+                if pubspec[key] is None:
+                    return None
+            elif key in _PUBSPEC_SECTIONS:
+                if value is not None:
+                    return None
+                # An empty block mapping is null in YAML, just like a missing one
+                pubspec[key] = None
+                section = key
+                child_indent = None
+        elif section == 'environment':
+            pubspec[section][key] = _pubspec_scalar(value)
+            if pubspec[section][key] is None:
+                return None
+        else:
+            pubspec[section][key] = value
+            
+    return pubspec
+
+def _load_pubspec(pubspec_path: Path):
+    """Load pubspec.yaml, reusing the JSON sidecar cache while the source mtime is unchanged"""
+    cache_path = pubspec_path.with_name(pubspec_path.name + '.cache.json')
+    mtime = pubspec_path.stat().st_mtime_ns
+    
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached['mtime'] == mtime:
+            return cached['data']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    with open(pubspec_path, 'r') as f:
+        text = f.read()
+    pubspec = _parse_pubspec_fast(text)
+    if pubspec is None or 'name' not in pubspec:
+        pubspec = yaml.load(text, Loader=SafeLoader)
+    
+    # Best effort: an unwritable directory or non-JSON YAML values just skip the cache
+    try:
+        payload = json.dumps({'mtime': mtime, 'data': pubspec})
+        with open(cache_path, 'w') as f:
+            f.write(payload)
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return pubspec
+
 def analyze_pubspec():
     """Analyze pubspec.yaml for dependencies"""
     pubspec_path = Path("pubspec.yaml")
@@ -17,9 +140,7 @@ def analyze_pubspec():
         return {"error": "pubspec.yaml not found"}
     
     try:
-        with open(pubspec_path, 'r') as f:
-            pubspec = yaml.safe_load(f)
-            
+        pubspec = _load_pubspec(pubspec_path)
         deps = pubspec.get('dependencies', {})
         dev_deps = pubspec.get('dev_dependencies', {})
         
@@ -39,16 +160,21 @@ def analyze_pubspec():
 def analyze_file_structure():
     """Analyze the Flutter project file structure"""
     structure = {}
-    dart_files = list(Path('.').rglob('*.dart'))
+    directories = {}
+    total = 0
     
-    structure['total_dart_files'] = len(dart_files)
-    structure['directories'] = {}
+    for dir_path, dir_names, file_names in os.walk('.'):
+        rel_dir = os.path.relpath(dir_path, '.')
+        dir_names[:] = [d for d in dir_names
+                        if d not in _SKIP_DIRS and os.path.join(rel_dir, d) not in _SKIP_DIRS]
+        
+        dart_files = [name for name in file_names if name.endswith('.dart')]
+        if dart_files:
+            directories[rel_dir] = dart_files
+            total += len(dart_files)
     
-    for dart_file in dart_files:
-        dir_name = str(dart_file.parent)
-        if dir_name not in structure['directories']:
-            structure['directories'][dir_name] = []
-        structure['directories'][dir_name].append(dart_file.name)
+    structure['total_dart_files'] = total
+    structure['directories'] = directories
     
     return structure
 
@@ -58,12 +184,21 @@ def analyze_imports(file_path):
         with open(file_path, 'r') as f:
             content = f.read()
             
-        imports = re.findall(r"import\s+['\"]([^'\"]+)['\"];", content)
+        imports = _IMPORT_RE.findall(content)
+        flutter_imports, local_imports, package_imports = [], [], []
+        for imp in imports:
+            if imp.startswith('package:flutter/'):
+                flutter_imports.append(imp)
+            elif imp.startswith('package:'):
+                package_imports.append(imp)
+            elif not imp.startswith('dart:'):
+                local_imports.append(imp)
+                
         return {
             "imports": imports,
-            "flutter_imports": [imp for imp in imports if imp.startswith('package:flutter/')],
-            "local_imports": [imp for imp in imports if not imp.startswith('package:') and not imp.startswith('dart:')],
-            "package_imports": [imp for imp in imports if imp.startswith('package:') and not imp.startswith('package:flutter/')]
+            "flutter_imports": flutter_imports,
+            "local_imports": local_imports,
+            "package_imports": package_imports
         }
     except Exception as e:
         return {"error": str(e)}
@@ -86,7 +221,7 @@ def analyze_main_files():
                 # Get file size and line count
                 with open(file_path, 'r') as f:
                     content = f.read()
-                    analysis[name]['lines'] = len(content.split('\n'))
+                    analysis[name]['lines'] = content.count('\n') + 1
                     analysis[name]['size'] = len(content)
             analysis[name]['exists'] = True
         else:
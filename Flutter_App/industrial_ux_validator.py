@@ -2,20 +2,379 @@
 """
 Industrial-Grade UX Validator
 Validates Flutter app for industrial-grade UX standards without Flutter SDK
+Requires Python 3.10+ (slotted dataclasses, int.bit_count)
 """
 
 import os
 import re
 import json
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Any
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Bound by _load_token_kernel; numpy is only needed once the Numba kernel is in use
+np = None
+
+# Every literal the validators look for in Dart sources; each file is scanned for all of them at once
+_CONTENT_TOKENS = (
+    # Material design
+    b'elevation:', b'boxShadow',
+    # Accessibility
+    b'semanticsLabel', b'Semantics(', b'FocusNode', b'focus:', b'textScaleFactor', b'MediaQuery',
+    b'ExcludeSemantics', b'MergeSemantics', b'ThemeData.dark', b'brightness: Brightness.dark',
+    # Performance
+    b'FutureBuilder', b'StreamBuilder', b'dispose()', b'initState()', b'AnimationController', b'Tween',
+    # Animations
+    b'onTap', b'Animation', b'scale', b'PageRouteBuilder', b'SlideTransition',
+    b'CircularProgressIndicator', b'LinearProgressIndicator', b'GestureDetector', b'Hero(',
+    # Theming
+    b'brightness:', b'Theme.of(context)', b'ThemeMode', b'theme:', b'Color(0x',
+    # Responsive design
+    b'MediaQuery.of(context).size', b'Orientation.', b'orientation:', b'SafeArea(', b'Flexible(',
+    b'Expanded(', b'Wrap(', b'LayoutBuilder', b'constraints',
+    # User flows
+    b'try {', b'catch', b'Navigator.', b'GoRouter', b'SnackBar', b'showDialog', b'ScaffoldMessenger'
+)
+
+_COLOR_RE = re.compile(rb'Color\(0x[0-9A-Fa-f]{8}\)')
+
+# Derived tags for checks that need more than a literal match; computed from the content at scan time
+_BRAND_COLORS = b'<brand colors>'
+_ONBOARDING = b'<onboarding>'
+
+# Per-file tags are cached as a bitfield over this tuple, so adding or reordering tags invalidates the cache
+_TAGS = _CONTENT_TOKENS + (_BRAND_COLORS, _ONBOARDING)
+_TAG_BITS = {tag: 1 << i for i, tag in enumerate(_TAGS)}
+_CACHE_NAME = '.ux_validator_cache.json'
+
+def _tag_mask(*tags: bytes) -> int:
+    """Bits of the given tags, for testing whether a file has any of them"""
+    return sum(_TAG_BITS[tag] for tag in tags)
+
+class _Checks:
+    """Pass/fail flags of one category; field order is report order and bit order"""
+    __slots__ = ()
+    
+    @classmethod
+    def from_mask(cls, passed: int):
+        return cls(*(bool(passed >> i & 1) for i in range(len(fields(cls)))))
+
+@dataclass(slots=True)
+class MaterialChecks(_Checks):
+    theme_implementation: bool = False
+    component_usage: bool = False
+    color_system: bool = False
+    typography: bool = False
+    elevation_shadows: bool = False
+
+@dataclass(slots=True)
+class AccessibilityChecks(_Checks):
+    semantic_labels: bool = False
+    focus_management: bool = False
+    color_contrast: bool = False
+    text_scaling: bool = False
+    screen_reader_support: bool = False
+
+@dataclass(slots=True)
+class PerformanceChecks(_Checks):
+    image_caching: bool = False
+    lazy_loading: bool = False
+    performance_monitoring: bool = False
+    memory_optimization: bool = False
+    smooth_animations: bool = False
+
+@dataclass(slots=True)
+class AnimationChecks(_Checks):
+    micro_interactions: bool = False
+    page_transitions: bool = False
+    loading_animations: bool = False
+    gesture_animations: bool = False
+    hero_animations: bool = False
+
+@dataclass(slots=True)
+class ThemingChecks(_Checks):
+    dark_light_theme: bool = False
+    consistent_colors: bool = False
+    custom_fonts: bool = False
+    theme_switching: bool = False
+    brand_consistency: bool = False
+
+@dataclass(slots=True)
+class ResponsiveChecks(_Checks):
+    screen_size_adaptation: bool = False
+    orientation_handling: bool = False
+    safe_area_usage: bool = False
+    flexible_layouts: bool = False
+    breakpoint_handling: bool = False
+
+@dataclass(slots=True)
+class FlowChecks(_Checks):
+    onboarding_flow: bool = False
+    authentication_flow: bool = False
+    error_handling_flow: bool = False
+    navigation_flow: bool = False
+    feedback_flow: bool = False
+
+def _check_bits(checks_cls) -> Dict[str, int]:
+    """One bit per check field, in report order"""
+    return {field.name: 1 << i for i, field in enumerate(fields(checks_cls))}
+
+# Each category is an int mask of passed checks; *_RULES list the content checks as
+# (check bit, clauses), where a file passes when it has at least one tag from every clause
+_MATERIAL_BITS = _check_bits(MaterialChecks)
+_MATERIAL_RULES = (
+    (_MATERIAL_BITS['elevation_shadows'], (_tag_mask(b'elevation:', b'boxShadow'),)),
+)
+_ACCESSIBILITY_BITS = _check_bits(AccessibilityChecks)
+_ACCESSIBILITY_RULES = (
+    (_ACCESSIBILITY_BITS['semantic_labels'], (_tag_mask(b'semanticsLabel', b'Semantics('),)),
+    (_ACCESSIBILITY_BITS['focus_management'], (_tag_mask(b'FocusNode', b'focus:'),)),
+    (_ACCESSIBILITY_BITS['text_scaling'], (_tag_mask(b'textScaleFactor', b'MediaQuery'),)),
+    (_ACCESSIBILITY_BITS['screen_reader_support'], (_tag_mask(b'ExcludeSemantics', b'MergeSemantics'),)),
+)
+_DARK_THEME_MASK = _tag_mask(b'ThemeData.dark', b'brightness: Brightness.dark')
+_PERFORMANCE_BITS = _check_bits(PerformanceChecks)
+_PERFORMANCE_RULES = (
+    (_PERFORMANCE_BITS['lazy_loading'], (_tag_mask(b'FutureBuilder', b'StreamBuilder'),)),
+    (_PERFORMANCE_BITS['memory_optimization'], (_tag_mask(b'dispose()'), _tag_mask(b'initState()'))),
+    (_PERFORMANCE_BITS['smooth_animations'], (_tag_mask(b'AnimationController', b'Tween'),)),
+)
+_ANIMATION_BITS = _check_bits(AnimationChecks)
+_ANIMATION_RULES = (
+    (_ANIMATION_BITS['micro_interactions'], (_tag_mask(b'onTap'), _tag_mask(b'Animation', b'scale'))),
+    (_ANIMATION_BITS['page_transitions'], (_tag_mask(b'PageRouteBuilder', b'SlideTransition'),)),
+    (_ANIMATION_BITS['loading_animations'], (_tag_mask(b'CircularProgressIndicator', b'LinearProgressIndicator'),)),
+    (_ANIMATION_BITS['gesture_animations'], (_tag_mask(b'GestureDetector'), _tag_mask(b'Animation'))),
+    (_ANIMATION_BITS['hero_animations'], (_tag_mask(b'Hero('),)),
+)
+_THEMING_BITS = _check_bits(ThemingChecks)
+_THEMING_RULES = (
+    (_THEMING_BITS['dark_light_theme'], (_tag_mask(b'ThemeData.dark', b'brightness:'),)),
+    (_THEMING_BITS['consistent_colors'], (_tag_mask(b'Theme.of(context)'),)),
+    (_THEMING_BITS['theme_switching'], (_tag_mask(b'ThemeMode', b'theme:'),)),
+    (_THEMING_BITS['brand_consistency'], (_tag_mask(_BRAND_COLORS),)),
+)
+_RESPONSIVE_BITS = _check_bits(ResponsiveChecks)
+_RESPONSIVE_RULES = (
+    (_RESPONSIVE_BITS['screen_size_adaptation'], (_tag_mask(b'MediaQuery.of(context).size'),)),
+    (_RESPONSIVE_BITS['orientation_handling'], (_tag_mask(b'Orientation.', b'orientation:'),)),
+    (_RESPONSIVE_BITS['safe_area_usage'], (_tag_mask(b'SafeArea('),)),
+    (_RESPONSIVE_BITS['flexible_layouts'], (_tag_mask(b'Flexible(', b'Expanded(', b'Wrap('),)),
+    (_RESPONSIVE_BITS['breakpoint_handling'], (_tag_mask(b'LayoutBuilder', b'constraints'),)),
+)
+_FLOW_BITS = _check_bits(FlowChecks)
+_FLOW_RULES = (
+    (_FLOW_BITS['onboarding_flow'], (_tag_mask(_ONBOARDING),)),
+    (_FLOW_BITS['error_handling_flow'], (_tag_mask(b'try {'), _tag_mask(b'catch'))),
+    (_FLOW_BITS['navigation_flow'], (_tag_mask(b'Navigator.', b'GoRouter'),)),
+    (_FLOW_BITS['feedback_flow'], (_tag_mask(b'SnackBar', b'showDialog', b'ScaffoldMessenger'),)),
+)
+_CONTENT_CLAUSES = tuple(clauses for rules in (_MATERIAL_RULES, _ACCESSIBILITY_RULES, _PERFORMANCE_RULES,
+                                               _ANIMATION_RULES, _THEMING_RULES, _RESPONSIVE_RULES, _FLOW_RULES)
+                         for _, clauses in rules)
+
+def _open_clauses(clauses, tags: int) -> list:
+    """The content checks, given as clause tuples, that a file with tags does not satisfy"""
+    return [c for c in clauses if not all(tags & mask for mask in c)]
+
+def _scan_token_bytes(buf, bucket_start, bucket_ids, offsets, data):
+    """Flag each token found in buf, trying at every position only the tokens that start with that byte"""
+    count = offsets.shape[0] - 1
+    found = np.zeros(count, dtype=np.uint8)
+    remaining = count
+    size = buf.shape[0]
+    for i in range(size):
+        c = buf[i]
+        for k in range(bucket_start[c], bucket_start[c + 1]):
+            t = bucket_ids[k]
+            start = offsets[t]
+            length = offsets[t + 1] - start
+            if found[t] or i + length > size:
+                continue
+            j = 1
+            while j < length and buf[i + j] == data[start + j]:
+                j += 1
+            if j == length:
+                found[t] = 1
+                remaining -= 1
+                if remaining == 0:
+                    return found
+    return found
+
+def _kernel_tables(tokens):
+    """Token bytes laid out for _scan_token_bytes: ids bucketed by first byte, plus offsets into the joined data"""
+    bucket_ids = sorted(range(len(tokens)), key=lambda t: tokens[t][0])
+    bucket_start = np.zeros(257, dtype=np.int64)
+    for token in tokens:
+        bucket_start[token[0] + 1] += 1
+    offsets = np.zeros(len(tokens) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(token) for token in tokens])
+    return (np.cumsum(bucket_start), np.array(bucket_ids, dtype=np.int64), offsets,
+            np.frombuffer(b''.join(tokens), dtype=np.uint8))
+
+# Without pyahocorasick, the generated scanner below handles small projects. Importing numba and loading the
+# cached kernel costs about 0.35s, while the kernel saves about 20ms per MB, so it takes over past this many bytes
+_KERNEL_MIN_BYTES = 16 * 1024 * 1024
+
+_scan_token_kernel = None
+_kernel_unavailable = False
+
+def _load_token_kernel():
+    """Import numba on first use and return a bytes -> tag bits scanner, or None when numba is not installed"""
+    global np, _scan_token_kernel, _kernel_unavailable
+    if _scan_token_kernel is None and not _kernel_unavailable:
+        try:
+            import numpy as np
+            from numba import njit
+        except ImportError:
+            _kernel_unavailable = True
+            return None
+        # Compiled once and cached on disk
+        compiled = njit(cache=True, nogil=True)(_scan_token_bytes)
+        tables = _kernel_tables(_CONTENT_TOKENS)
+        bits = [_TAG_BITS[token] for token in _CONTENT_TOKENS]
+        
+        def scan(content):
+            tags = 0
+            for t in np.flatnonzero(compiled(np.frombuffer(content, dtype=np.uint8), *tables)):
+                tags |= bits[t]
+            return tags
+        _scan_token_kernel = scan
+    return _scan_token_kernel
+
+def _build_token_scanner(tokens):
+    """Generate scan(content) -> tag bits with one inline substring test per token.
+    A token that contains a shorter token is only tested once the shorter one has been found"""
+    parents = {token: max((other for other in tokens if other != token and other in token), key=len, default=None)
+               for token in tokens}
+    lines = ['def scan(b):', '    tags = 0']
+    
+    def emit(parent, indent):
+        for token in tokens:
+            if parents[token] == parent:
+                lines.append(f'{indent}if {token!r} in b:')
+                lines.append(f'{indent}    tags |= {_TAG_BITS[token]}')
+                emit(token, indent + '    ')
+                
+    emit(None, '    ')
+    lines.append('    return tags')
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['scan']
+
+# Dependency-free scanner, specialized to the fixed token set once at import
+_scan_token_source = _build_token_scanner(_CONTENT_TOKENS)
+
+def _has_matches(pattern: re.Pattern, content: bytes, n: int) -> bool:
+    """True if pattern matches content at least n times; stops scanning at the nth match"""
+    return sum(1 for _ in islice(pattern.finditer(content), n)) >= n
+
+# Grade bands: a percentage at or above _GRADE_THRESHOLDS[i] earns _GRADES[i + 1]
+_GRADE_THRESHOLDS = (60, 70, 80, 90)
+_GRADES = (
+    ("C (Below Standard)", "❌ REQUIRES MAJOR WORK"),
+    ("B (Acceptable)", "⚠️ NEEDS IMPROVEMENT"),
+    ("B+ (Good Standard)", "👍 GOOD"),
+    ("A (Professional Grade)", "✅ VERY GOOD"),
+    ("A+ (Industrial Grade)", "🏆 EXCELLENT")
+)
+
+# Threads used to read Dart sources; file reads drop the GIL
+_MAX_WORKERS = 8
+# Reads queued ahead of the scanner while the walk is still running
+_READ_AHEAD = _MAX_WORKERS * 4
+
+# Large files are peeked first; the rest is only read while some content check is still open.
+# A token can straddle the peek boundary, so the tail scan starts this many bytes early
+_PEEK_SIZE = 8192
+_TOKEN_OVERLAP = max(len(token) for token in _CONTENT_TOKENS) - 1
+
+def _read_head(path: str, size):
+    """(data, complete) with up to _PEEK_SIZE bytes of a larger file, or None if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            if size is not None and size > _PEEK_SIZE:
+                data = f.read(_PEEK_SIZE)
+                return data, len(data) < _PEEK_SIZE
+            return f.read(), True
+    except OSError:
+        return None
+
+def _read_from(path: str, offset: int):
+    """Contents of path from offset on, or None if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return f.read()
+    except OSError:
+        return None
+
+# File name categories in one pass; named groups pick the bucket. Case-sensitive, like the globs it replaced.
+# The lookahead keeps matches zero-width, so overlapping names such as 'autheme' land in both auth and theme
+_FILENAME_CLASSIFIER = re.compile(
+    r'(?=(?P<theme>theme)|(?P<color>color)|(?P<typography>typography)|(?P<cache>cache)'
+    r'|(?P<performance>performance)|(?P<auth>auth)|^(?P<premium>premium_))'
+)
+
+# Build output, tool caches and native platform trees never hold app sources worth validating
+_PRUNE_DIRS = frozenset({'build', '.dart_tool', '.git', '.idea', 'ios', 'android', '.pub-cache', 'node_modules'})
+_GENERATED_SUFFIXES = ('.g.dart', '.freezed.dart')
+
+def _iter_dart_entries(path: str, exclude_dirs=_PRUNE_DIRS, include_generated: bool = False):
+    """Yield DirEntry objects for Dart files under path; scandir caches the dirent type, so no extra stat() per entry"""
+    try:
+        it = os.scandir(path)
+    except OSError:
+        # Unreadable or vanished directories are skipped, as rglob and os.walk do
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude_dirs:
+                    yield from _iter_dart_entries(entry.path, exclude_dirs, include_generated)
+            elif entry.name.endswith('.dart') and entry.is_file():
+                if include_generated or not entry.name.endswith(_GENERATED_SUFFIXES):
+                    yield entry
+
 class IndustrialUXValidator:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, exclude_dirs=_PRUNE_DIRS, include_generated: bool = False):
         self.project_root = Path(project_root)
+        self.exclude_dirs = frozenset(exclude_dirs)
+        self.include_generated = include_generated
         self.ux_score = 0
         self.max_score = 100
         self.validations = []
+        self._dart_hits: Dict[str, int] = {}
+        self._cache_path = self.project_root / _CACHE_NAME
+        self._cache_entries: Dict[str, list] = {}
+        self._cache_dirty = False
+        self._open_clauses: List[tuple] = []
+        self._theme_files: List[str] = []
+        self._color_files: List[str] = []
+        self._typography_files: List[str] = []
+        self._cache_files: List[str] = []
+        self._perf_files: List[str] = []
+        self._auth_files: List[str] = []
+        self._premium_components: List[str] = []
+        
+        # One Aho-Corasick automaton finds every token in a single pass over each file.
+        # Unicode builds of pyahocorasick only take str, so bytes go through latin-1, which maps each byte to one char
+        self._automaton = None
+        self._scanned_bytes = 0
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for token in _CONTENT_TOKENS:
+                self._automaton.add_word(token.decode('latin-1') if ahocorasick.unicode else token, _TAG_BITS[token])
+            self._automaton.make_automaton()
         
     def validate_complete_ux(self) -> Dict[str, Any]:
         """Comprehensive UX validation"""
@@ -34,6 +393,9 @@ class IndustrialUXValidator:
             'summary': {}
         }
         
+        # Read the project once for every validation below
+        self._collect_dart_files()
+        
         # Core UX Validations
         self._validate_material_design(results)
         self._validate_accessibility(results) 
@@ -46,57 +408,187 @@ class IndustrialUXValidator:
         # Calculate final score
         self._calculate_ux_score(results)
         
+        self._save_cache()
+        
         return results
     
+    def _collect_dart_files(self):
+        """Walk the project once, scanning every changed Dart file and bucketing them by file name"""
+        self._dart_hits = {}
+        self._theme_files = []
+        self._color_files = []
+        self._typography_files = []
+        self._cache_files = []
+        self._perf_files = []
+        self._auth_files = []
+        self._premium_components = []
+        
+        cached = self._load_cache()
+        self._cache_entries = {}
+        self._cache_dirty = False
+        
+        # Content checks no file has satisfied yet; once none are left, the rest of a large file cannot matter
+        self._open_clauses = list(_CONTENT_CLAUSES)
+        
+        buckets = {
+            'theme': self._theme_files,
+            'color': self._color_files,
+            'typography': self._typography_files,
+            'cache': self._cache_files,
+            'performance': self._perf_files,
+            'auth': self._auth_files,
+            'premium': self._premium_components
+        }
+        
+        # Reads start while the walk is still running; this thread scans them in order as they arrive
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+            for entry in _iter_dart_entries(str(self.project_root), self.exclude_dirs, self.include_generated):
+                # A name can fall into several categories, but each at most once
+                categories = {match.lastgroup for match in _FILENAME_CLASSIFIER.finditer(entry.name)}
+                for category in categories:
+                    buckets[category].append(entry.path)
+                    
+                try:
+                    st = entry.stat()
+                    key = [st.st_mtime_ns, st.st_size]
+                except OSError:
+                    key = None
+                entry_cache = cached.get(entry.path)
+                if key is not None and entry_cache is not None and entry_cache[:2] == key:
+                    self._cache_entries[entry.path] = entry_cache
+                    self._dart_hits[entry.path] = entry_cache[2]
+                    self._open_clauses = _open_clauses(self._open_clauses, entry_cache[2])
+                    continue
+                    
+                self._cache_dirty = True
+                head = pool.submit(_read_head, entry.path, key and key[1])
+                pending.append((entry.path, key, 'theme' in categories, head))
+                if len(pending) >= _READ_AHEAD:
+                    self._finish_scan(*pending.popleft())
+                    
+            while pending:
+                self._finish_scan(*pending.popleft())
+                
+        if len(self._cache_entries) != len(cached):
+            self._cache_dirty = True
+    
+    def _finish_scan(self, path: str, key, is_theme: bool, head):
+        """Scan a file once its head has been read, reading the rest only if it can still matter"""
+        head = head.result()
+        if head is None:
+            return
+        content, complete = head
+        tags = self._scan_tags(content)
+        # Theme files also feed the per-file color contrast check, so they are always read in full
+        if not complete and (self._open_clauses or is_theme):
+            rest = _read_from(path, len(content))
+            if rest is not None:
+                tags |= self._scan_literals(content[-_TOKEN_OVERLAP:] + rest)
+                content += rest
+                tags |= self._derived_tags(content, tags)
+                complete = True
+        self._dart_hits[path] = tags
+        self._open_clauses = _open_clauses(self._open_clauses, tags)
+        # Tags from a peek may be missing some, so only complete scans are cached
+        if complete and key is not None:
+            self._cache_entries[path] = key + [tags]
+    
+    def _scan_tags(self, content: bytes) -> int:
+        """Bits of the _CONTENT_TOKENS occurring in content, plus the derived brand color and onboarding tags"""
+        tags = self._scan_literals(content)
+        return tags | self._derived_tags(content, tags)
+    
+    def _scan_literals(self, content: bytes) -> int:
+        """Bits of the _CONTENT_TOKENS occurring in content"""
+        tags = 0
+        if self._automaton is not None:
+            text = content.decode('latin-1') if ahocorasick.unicode else content
+            for _, bit in self._automaton.iter(text):
+                tags |= bit
+        else:
+            self._scanned_bytes += len(content)
+            kernel = _load_token_kernel() if self._scanned_bytes > _KERNEL_MIN_BYTES else None
+            tags = kernel(content) if kernel is not None else _scan_token_source(content)
+        return tags
+    
+    def _derived_tags(self, content: bytes, tags: int) -> int:
+        """tags with the brand color and onboarding bits added, given the literal tags of content"""
+        if tags & _TAG_BITS[b'Color(0x'] and _has_matches(_COLOR_RE, content, 3):
+            tags |= _TAG_BITS[_BRAND_COLORS]
+        lowered = content.lower()
+        if b'onboard' in lowered or b'intro' in lowered:
+            tags |= _TAG_BITS[_ONBOARDING]
+        return tags
+    
+    def _match_rules(self, rules, passed: int, full: int) -> int:
+        """Add the bits of rules any file satisfies to passed, stopping once every check has passed"""
+        for tags in self._dart_hits.values():
+            if passed == full:
+                break
+            for check, clauses in rules:
+                if not passed & check and all(tags & clause for clause in clauses):
+                    passed |= check
+        return passed
+    
+    def _load_cache(self) -> Dict[str, list]:
+        """Per-file [mtime_ns, size, tag bits] from the last run, or {} if missing, malformed or built for other tags"""
+        try:
+            with open(self._cache_path, 'r') as f:
+                cached = json.load(f)
+            files = cached['files']
+            if (cached['tags'] == [tag.decode('latin-1') for tag in _TAGS] and isinstance(files, dict)
+                    and all(isinstance(entry, list) and len(entry) == 3 and all(type(v) is int for v in entry)
+                            for entry in files.values())):
+                return files
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+    
+    def _save_cache(self):
+        """Persist the per-file tag cache if this run changed it"""
+        if not self._cache_dirty:
+            return
+        # Best effort: an unwritable project directory just skips the cache
+        try:
+            payload = json.dumps({
+                'tags': [tag.decode('latin-1') for tag in _TAGS],
+                'files': self._cache_entries
+            })
+            with open(self._cache_path, 'w') as f:
+                f.write(payload)
+            self._cache_dirty = False
+        except OSError:
+            pass
+    
     def _validate_material_design(self, results: Dict):
         """Validate Material Design 3 implementation"""
         print("📱 Validating Material Design 3 implementation...")
         
-        material_checks = {
-            'theme_implementation': False,
-            'component_usage': False,
-            'color_system': False,
-            'typography': False,
-            'elevation_shadows': False
-        }
+        bits = _MATERIAL_BITS
+        passed = 0
         
         # Check for theme files
-        theme_files = list(self.project_root.rglob("*theme*.dart"))
-        if theme_files:
-            material_checks['theme_implementation'] = True
+        if self._theme_files:
+            passed |= bits['theme_implementation']
             
         # Check for color system
-        color_files = list(self.project_root.rglob("*color*.dart"))
-        if color_files:
-            material_checks['color_system'] = True
+        if self._color_files:
+            passed |= bits['color_system']
             
         # Check for typography
-        typography_files = list(self.project_root.rglob("*typography*.dart"))
-        if typography_files:
-            material_checks['typography'] = True
+        if self._typography_files:
+            passed |= bits['typography']
             
         # Check for premium components
-        component_files = list(self.project_root.rglob("premium_*.dart"))
-        if len(component_files) >= 3:  # At least 3 premium components
-            material_checks['component_usage'] = True
+        if len(self._premium_components) >= 3:  # At least 3 premium components
+            passed |= bits['component_usage']
             
         # Check for elevation/shadow usage in code
-        dart_files = list(self.project_root.rglob("*.dart"))
-        elevation_found = False
-        for file_path in dart_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    if 'elevation:' in content or 'boxShadow' in content:
-                        elevation_found = True
-                        break
-            except:
-                continue
-                
-        material_checks['elevation_shadows'] = elevation_found
+        passed = self._match_rules(_MATERIAL_RULES, passed, (1 << len(bits)) - 1)
         
-        results['material_design'] = material_checks
-        score = sum(material_checks.values()) * 4  # 20 points max
+        results['material_design'] = MaterialChecks.from_mask(passed)
+        score = passed.bit_count() * 4  # 20 points max
         results['ux_score'] += score
         
         print(f"  ✅ Material Design Score: {score}/20")
@@ -105,54 +597,20 @@ class IndustrialUXValidator:
         """Validate accessibility implementation"""
         print("♿ Validating accessibility features...")
         
-        accessibility_checks = {
-            'semantic_labels': False,
-            'focus_management': False,
-            'color_contrast': False,
-            'text_scaling': False,
-            'screen_reader_support': False
-        }
-        
-        dart_files = list(self.project_root.rglob("*.dart"))
+        bits = _ACCESSIBILITY_BITS
+        passed = 0
         
-        for file_path in dart_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    
-                # Check for semantic labels
-                if 'semanticsLabel' in content or 'Semantics(' in content:
-                    accessibility_checks['semantic_labels'] = True
-                    
-                # Check for focus management
-                if 'FocusNode' in content or 'focus:' in content:
-                    accessibility_checks['focus_management'] = True
-                    
-                # Check for text scaling support
-                if 'textScaleFactor' in content or 'MediaQuery' in content:
-                    accessibility_checks['text_scaling'] = True
-                    
-                # Check for screen reader support
-                if 'ExcludeSemantics' in content or 'MergeSemantics' in content:
-                    accessibility_checks['screen_reader_support'] = True
-                    
-            except:
-                continue
-                
         # Color contrast check (basic - check for dark theme)
-        theme_files = list(self.project_root.rglob("*theme*.dart"))
-        for theme_file in theme_files:
-            try:
-                with open(theme_file, 'r') as f:
-                    content = f.read()
-                    if 'ThemeData.dark' in content or 'brightness: Brightness.dark' in content:
-                        accessibility_checks['color_contrast'] = True
-                        break
-            except:
-                continue
+        for theme_file in self._theme_files:
+            if self._dart_hits.get(theme_file, 0) & _DARK_THEME_MASK:
+                passed |= bits['color_contrast']
+                break
         
-        results['accessibility'] = accessibility_checks
-        score = sum(accessibility_checks.values()) * 3  # 15 points max
+        # Semantic labels, focus management, text scaling and screen reader support
+        passed = self._match_rules(_ACCESSIBILITY_RULES, passed, (1 << len(bits)) - 1)
+        
+        results['accessibility'] = AccessibilityChecks.from_mask(passed)
+        score = passed.bit_count() * 3  # 15 points max
         results['ux_score'] += score
         
         print(f"  ✅ Accessibility Score: {score}/15")
@@ -161,48 +619,22 @@ class IndustrialUXValidator:
         """Validate performance-related UX features"""
         print("⚡ Validating performance UX features...")
         
-        performance_checks = {
-            'image_caching': False,
-            'lazy_loading': False,
-            'performance_monitoring': False,
-            'memory_optimization': False,
-            'smooth_animations': False
-        }
+        bits = _PERFORMANCE_BITS
+        passed = 0
         
         # Check for caching implementation
-        cache_files = list(self.project_root.rglob("*cache*.dart"))
-        if cache_files:
-            performance_checks['image_caching'] = True
+        if self._cache_files:
+            passed |= bits['image_caching']
             
         # Check for performance monitoring
-        perf_files = list(self.project_root.rglob("*performance*.dart"))
-        if perf_files:
-            performance_checks['performance_monitoring'] = True
+        if self._perf_files:
+            passed |= bits['performance_monitoring']
             
-        dart_files = list(self.project_root.rglob("*.dart"))
+        # Lazy loading, memory optimization and smooth animations
+        passed = self._match_rules(_PERFORMANCE_RULES, passed, (1 << len(bits)) - 1)
         
-        for file_path in dart_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    
-                # Check for lazy loading patterns
-                if 'FutureBuilder' in content or 'StreamBuilder' in content:
-                    performance_checks['lazy_loading'] = True
-                    
-                # Check for memory optimization
-                if 'dispose()' in content and 'initState()' in content:
-                    performance_checks['memory_optimization'] = True
-                    
-                # Check for smooth animations
-                if 'AnimationController' in content or 'Tween' in content:
-                    performance_checks['smooth_animations'] = True
-                    
-            except:
-                continue
-                
-        results['performance'] = performance_checks
-        score = sum(performance_checks.values()) * 3  # 15 points max
+        results['performance'] = PerformanceChecks.from_mask(passed)
+        score = passed.bit_count() * 3  # 15 points max
         results['ux_score'] += score
         
         print(f"  ✅ Performance UX Score: {score}/15")
@@ -211,46 +643,11 @@ class IndustrialUXValidator:
         """Validate animation implementation"""
         print("✨ Validating animation implementation...")
         
-        animation_checks = {
-            'micro_interactions': False,
-            'page_transitions': False,
-            'loading_animations': False,
-            'gesture_animations': False,
-            'hero_animations': False
-        }
-        
-        dart_files = list(self.project_root.rglob("*.dart"))
+        bits = _ANIMATION_BITS
+        passed = self._match_rules(_ANIMATION_RULES, 0, (1 << len(bits)) - 1)
         
-        for file_path in dart_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    
-                # Check for micro-interactions
-                if 'onTap' in content and ('Animation' in content or 'scale' in content):
-                    animation_checks['micro_interactions'] = True
-                    
-                # Check for page transitions
-                if 'PageRouteBuilder' in content or 'SlideTransition' in content:
-                    animation_checks['page_transitions'] = True
-                    
-                # Check for loading animations
-                if 'CircularProgressIndicator' in content or 'LinearProgressIndicator' in content:
-                    animation_checks['loading_animations'] = True
-                    
-                # Check for gesture animations
-                if 'GestureDetector' in content and 'Animation' in content:
-                    animation_checks['gesture_animations'] = True
-                    
-                # Check for hero animations
-                if 'Hero(' in content:
-                    animation_checks['hero_animations'] = True
-                    
-            except:
-                continue
-                
-        results['animations'] = animation_checks
-        score = sum(animation_checks.values()) * 2  # 10 points max
+        results['animations'] = AnimationChecks.from_mask(passed)
+        score = passed.bit_count() * 2  # 10 points max
         results['ux_score'] += score
         
         print(f"  ✅ Animation Score: {score}/10")
@@ -259,53 +656,23 @@ class IndustrialUXValidator:
         """Validate theming system"""
         print("🎨 Validating theming system...")
         
-        theming_checks = {
-            'dark_light_theme': False,
-            'consistent_colors': False,
-            'custom_fonts': False,
-            'theme_switching': False,
-            'brand_consistency': False
-        }
+        bits = _THEMING_BITS
+        passed = 0
         
         # Check pubspec.yaml for custom fonts
         pubspec_path = self.project_root / "pubspec.yaml"
         if pubspec_path.exists():
             try:
-                with open(pubspec_path, 'r') as f:
-                    content = f.read()
-                    if 'fonts:' in content:
-                        theming_checks['custom_fonts'] = True
-            except:
+                if b'fonts:' in pubspec_path.read_bytes():
+                    passed |= bits['custom_fonts']
+            except OSError:
                 pass
                 
-        dart_files = list(self.project_root.rglob("*.dart"))
+        # Dark/light theme, consistent colors, theme switching and brand colors
+        passed = self._match_rules(_THEMING_RULES, passed, (1 << len(bits)) - 1)
         
-        for file_path in dart_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    
-                # Check for dark/light theme
-                if 'ThemeData.dark' in content or 'brightness:' in content:
-                    theming_checks['dark_light_theme'] = True
-                    
-                # Check for consistent color usage
-                if 'Theme.of(context)' in content:
-                    theming_checks['consistent_colors'] = True
-                    
-                # Check for theme switching capability
-                if 'ThemeMode' in content or 'theme:' in content:
-                    theming_checks['theme_switching'] = True
-                    
-                # Check for brand consistency (custom colors)
-                if 'Color(0x' in content and len(re.findall(r'Color\(0x[0-9A-Fa-f]{8}\)', content)) >= 3:
-                    theming_checks['brand_consistency'] = True
-                    
-            except:
-                continue
-                
-        results['theming'] = theming_checks
-        score = sum(theming_checks.values()) * 3  # 15 points max
+        results['theming'] = ThemingChecks.from_mask(passed)
+        score = passed.bit_count() * 3  # 15 points max
         results['ux_score'] += score
         
         print(f"  ✅ Theming Score: {score}/15")
@@ -314,46 +681,11 @@ class IndustrialUXValidator:
         """Validate responsive design implementation"""
         print("📱 Validating responsive design...")
         
-        responsive_checks = {
-            'screen_size_adaptation': False,
-            'orientation_handling': False,
-            'safe_area_usage': False,
-            'flexible_layouts': False,
-            'breakpoint_handling': False
-        }
-        
-        dart_files = list(self.project_root.rglob("*.dart"))
+        bits = _RESPONSIVE_BITS
+        passed = self._match_rules(_RESPONSIVE_RULES, 0, (1 << len(bits)) - 1)
         
-        for file_path in dart_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    
-                # Check for screen size adaptation
-                if 'MediaQuery.of(context).size' in content:
-                    responsive_checks['screen_size_adaptation'] = True
-                    
-                # Check for orientation handling
-                if 'Orientation.' in content or 'orientation:' in content:
-                    responsive_checks['orientation_handling'] = True
-                    
-                # Check for safe area usage
-                if 'SafeArea(' in content:
-                    responsive_checks['safe_area_usage'] = True
-                    
-                # Check for flexible layouts
-                if ('Flexible(' in content or 'Expanded(' in content or 'Wrap(' in content):
-                    responsive_checks['flexible_layouts'] = True
-                    
-                # Check for breakpoint handling
-                if 'LayoutBuilder' in content or 'constraints' in content:
-                    responsive_checks['breakpoint_handling'] = True
-                    
-            except:
-                continue
-                
-        results['responsive_design'] = responsive_checks
-        score = sum(responsive_checks.values()) * 2  # 10 points max
+        results['responsive_design'] = ResponsiveChecks.from_mask(passed)
+        score = passed.bit_count() * 2  # 10 points max
         results['ux_score'] += score
         
         print(f"  ✅ Responsive Design Score: {score}/10")
@@ -362,48 +694,18 @@ class IndustrialUXValidator:
         """Validate user flow implementation"""
         print("🔄 Validating user flows...")
         
-        flow_checks = {
-            'onboarding_flow': False,
-            'authentication_flow': False,
-            'error_handling_flow': False,
-            'navigation_flow': False,
-            'feedback_flow': False
-        }
+        bits = _FLOW_BITS
+        passed = 0
         
         # Check for authentication files
-        auth_files = list(self.project_root.rglob("*auth*.dart"))
-        if auth_files:
-            flow_checks['authentication_flow'] = True
+        if self._auth_files:
+            passed |= bits['authentication_flow']
             
-        dart_files = list(self.project_root.rglob("*.dart"))
+        # Onboarding, error handling, navigation and user feedback
+        passed = self._match_rules(_FLOW_RULES, passed, (1 << len(bits)) - 1)
         
-        for file_path in dart_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    
-                # Check for onboarding
-                if 'onboard' in content.lower() or 'intro' in content.lower():
-                    flow_checks['onboarding_flow'] = True
-                    
-                # Check for error handling
-                if 'try {' in content and 'catch' in content:
-                    flow_checks['error_handling_flow'] = True
-                    
-                # Check for navigation
-                if 'Navigator.' in content or 'GoRouter' in content:
-                    flow_checks['navigation_flow'] = True
-                    
-                # Check for user feedback
-                if ('SnackBar' in content or 'showDialog' in content or 
-                    'ScaffoldMessenger' in content):
-                    flow_checks['feedback_flow'] = True
-                    
-            except:
-                continue
-                
-        results['user_flows'] = flow_checks
-        score = sum(flow_checks.values()) * 3  # 15 points max
+        results['user_flows'] = FlowChecks.from_mask(passed)
+        score = passed.bit_count() * 3  # 15 points max
         results['ux_score'] += score
         
         print(f"  ✅ User Flow Score: {score}/15")
@@ -413,21 +715,7 @@ class IndustrialUXValidator:
         final_score = min(results['ux_score'], self.max_score)
         percentage = (final_score / self.max_score) * 100
         
-        if percentage >= 90:
-            grade = "A+ (Industrial Grade)"
-            status = "🏆 EXCELLENT"
-        elif percentage >= 80:
-            grade = "A (Professional Grade)"
-            status = "✅ VERY GOOD"
-        elif percentage >= 70:
-            grade = "B+ (Good Standard)"
-            status = "👍 GOOD"
-        elif percentage >= 60:
-            grade = "B (Acceptable)"
-            status = "⚠️ NEEDS IMPROVEMENT"
-        else:
-            grade = "C (Below Standard)"
-            status = "❌ REQUIRES MAJOR WORK"
+        grade, status = _GRADES[bisect_right(_GRADE_THRESHOLDS, percentage)]
             
         results['summary'] = {
             'final_score': final_score,
@@ -444,23 +732,23 @@ class IndustrialUXValidator:
         
         # Material Design recommendations
         md = results['material_design']
-        if not md['theme_implementation']:
+        if not md.theme_implementation:
             recommendations.append("Implement comprehensive Material Design 3 theme")
-        if not md['component_usage']:
+        if not md.component_usage:
             recommendations.append("Create more premium UI components")
             
         # Accessibility recommendations
         acc = results['accessibility']
-        if not acc['semantic_labels']:
+        if not acc.semantic_labels:
             recommendations.append("Add semantic labels for screen readers")
-        if not acc['focus_management']:
+        if not acc.focus_management:
             recommendations.append("Implement proper focus management")
             
         # Performance recommendations
         perf = results['performance']
-        if not perf['image_caching']:
+        if not perf.image_caching:
             recommendations.append("Implement advanced image caching system")
-        if not perf['lazy_loading']:
+        if not perf.lazy_loading:
             recommendations.append("Add lazy loading for better performance")
             
         return recommendations[:5]  # Top 5 recommendations
@@ -496,6 +784,7 @@ def main():
     ]
     
     for name, checks, max_points in categories:
+        checks = asdict(checks)
         score = sum(checks.values()) * (max_points // len(checks))
         status = "✅" if score >= max_points * 0.8 else "⚠️" if score >= max_points * 0.6 else "❌"
         print(f"{status} {name}: {score}/{max_points}")
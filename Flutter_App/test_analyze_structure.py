@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the pubspec fast path in analyze_structure.py
+Run from Flutter_App with: python3 -m unittest
+"""
+
+import unittest
+from pathlib import Path
+
+import yaml
+
+from analyze_structure import _parse_pubspec_fast
+
+_BASE = """name: app
+version: 1.0.0+1
+
+environment:
+  sdk: '>=3.1.0 <4.0.0'
+  flutter: ">=3.13.0"
+
+dependencies:
+  flutter:
+    sdk: flutter
+  dio: ^5.4.0
+
+dev_dependencies:
+  flutter_test:
+    sdk: flutter
+  mocktail: ^1.0.1
+"""
+
+# (label, pubspec text, whether the fast reader should handle it rather than defer to YAML)
+_CASES = (
+    ('base', _BASE, True),
+    ('crlf line endings', _BASE.replace('\n', '\r\n'), True),
+    ('single-quoted name', "name: 'app'\n", True),
+    ('double-quoted version', 'name: app\nversion: "1.0.0+1"\n', True),
+    ('quoted scalar holding a colon', "name: 'a: b'\n", True),
+    ('quoted scalar holding a hash', "name: 'a #b'\n", False),
+    ('escaped double-quoted scalar', 'name: "a\\tb"\n', False),
+    ('unbalanced quote', "name: 'app\n", False),
+    ('float version', 'name: app\nversion: 1.0\n', False),
+    ('int version', 'name: app\nversion: 1\n', False),
+    ('bool name', 'name: true\n', False),
+    ('null name', 'name: ~\n', False),
+    ('empty name', 'name:\n', False),
+    ('plain scalar with a colon', 'name: a: b\n', False),
+    ('hash without a space', 'name: a#b\n', True),
+    ('trailing comment', 'name: app # the app\nversion: 1.0.0 # bump on release\n', True),
+    ('comment lines', '# header\nname: app\n  # indented comment\ndependencies:\n  # none yet\n  dio: ^5.4.0\n', True),
+    ('comment with a quote', "name: app # it's ours\n", False),
+    ('tab in value', 'name: app\tx\n', False),
+    ('tab after colon', 'name:\tapp\n', False),
+    ('flow mapping section', 'name: app\ndependencies: {dio: ^5.4.0}\n', False),
+    ('flow sequence name', 'name: [app]\n', False),
+    ('literal block name', 'name: |\n  app\n', False),
+    ('folded block description', 'name: app\ndescription: >\n  A long\n  description\n', True),
+    ('continued plain name', 'name: app\n  continued\n', False),
+    ('document marker', '---\nname: app\n', False),
+    ('anchor', 'name: &n app\n', False),
+    ('empty section', 'name: app\ndependencies:\ndev_dependencies:\n  mocktail: ^1.0.1\n', True),
+    ('nested sdk and git sources', 'name: app\ndependencies:\n  flutter:\n    sdk: flutter\n  pkg:\n    git:\n      url: https://example.com/pkg.git\n      ref: main\n  dio: ^5.4.0\n', True),
+    ('nested environment value', 'name: app\nenvironment:\n  sdk:\n    min: 3.0.0\n', False),
+    ('dedent below first child', 'name: app\ndependencies:\n    dio: ^5.4.0\n  http: ^1.1.0\n', False),
+    ('unknown top-level keys', "name: app\npublish_to: 'none'\nflutter:\n  uses-material-design: true\n  fonts:\n    - family: Inter\n", True),
+    ('environment sdk only', "name: app\nenvironment:\n  sdk: '>=3.1.0 <4.0.0'\n", True),
+)
+
+def _pubspec_view(pubspec: dict):
+    """The parts of a parsed pubspec that analyze_pubspec reads"""
+    def keys(section):
+        value = pubspec.get(section)
+        return None if value is None else list(value)
+    return (pubspec.get('name'), pubspec.get('version'), pubspec.get('environment'),
+            keys('dependencies'), keys('dev_dependencies'))
+
+class ParsePubspecFastTest(unittest.TestCase):
+    def test_matches_yaml(self):
+        for label, text, fast in _CASES:
+            with self.subTest(label):
+                parsed = _parse_pubspec_fast(text)
+                self.assertEqual(parsed is not None, fast)
+                if parsed is not None:
+                    self.assertEqual(_pubspec_view(parsed), _pubspec_view(yaml.safe_load(text)))
+
+    def test_project_pubspec(self):
+        text = (Path(__file__).parent / 'pubspec.yaml').read_text()
+        parsed = _parse_pubspec_fast(text)
+        self.assertIsNotNone(parsed)
+        self.assertEqual(_pubspec_view(parsed), _pubspec_view(yaml.safe_load(text)))
+
+if __name__ == '__main__':
+    unittest.main()
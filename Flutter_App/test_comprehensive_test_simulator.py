@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the test-file scanners in comprehensive_test_simulator.py
+Run from Flutter_App with: python3 -m unittest
+"""
+
+import importlib.util
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import comprehensive_test_simulator as sim
+from comprehensive_test_simulator import ComprehensiveTestSimulator, _SPACED_EXPECT_RE, _SPACED_TEST_RE
+
+_ATOMS = (b'test(', b'test (', b'test\t\n(', b'expect(', b'expect  (', b'expect\r\n(', b'(', b' ', b'\n', b'\r\n',
+          b'\x0b', b'\x0c', b'tes', b't', b'exp', b'ect', b'xtest(', b'group(', b'testWidgets(', b'final x = 1;')
+
+def _reference(data: bytes):
+    """(lines, test calls, expect calls) from the bytes.count/regex path"""
+    return (sim._line_count(data),
+            sim._count_calls(data, b'test', _SPACED_TEST_RE),
+            sim._count_calls(data, b'expect', _SPACED_EXPECT_RE))
+
+@unittest.skipIf(importlib.util.find_spec('numba') is None, "numba is not installed")
+class ScanKernelTest(unittest.TestCase):
+    def test_matches_count_calls(self):
+        kernel = sim._load_test_kernel()
+        rng = random.Random(0)
+        for n in range(3000):
+            data = b''.join(rng.choices(_ATOMS, k=rng.randint(0, 30)))
+            with self.subTest(n=n, data=data):
+                newlines, tests, expects = kernel(data)
+                self.assertEqual((sim._line_count(data, newlines), tests, expects), _reference(data))
+
+    def test_collect_with_kernel(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        rng = random.Random(1)
+        for rel in ('test/unit', 'test/widget', 'packages/app/test/integration', 'lib/services'):
+            os.makedirs(os.path.join(root, rel))
+            for i in range(3):
+                with open(os.path.join(root, rel, 'auth_%d_test.dart' % i), 'wb') as f:
+                    f.write(b''.join(rng.choices(_ATOMS, k=rng.randint(0, 200))))
+
+        expected = ComprehensiveTestSimulator(root)
+        expected._collect_dart_files()
+        with mock.patch.object(sim, '_KERNEL_MIN_BYTES', -1):
+            scanned = ComprehensiveTestSimulator(root)
+            scanned._collect_dart_files()
+        self.assertEqual(scanned._file_index, expected._file_index)
+
+if __name__ == '__main__':
+    unittest.main()
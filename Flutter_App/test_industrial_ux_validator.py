@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the scanning, peeking, caching and file classification in industrial_ux_validator.py
+Run from Flutter_App with: python3 -m unittest
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import industrial_ux_validator as ux
+from industrial_ux_validator import IndustrialUXValidator, _CONTENT_TOKENS, _PEEK_SIZE, _TAG_BITS
+
+# Names that share characters between categories, e.g. auth and theme in 'autheme'
+_NAMES = ('main', 'app_theme', 'autheme', 'oautheme_x', 'colors', 'typography', 'premium_button', 'premium_theme',
+          'cache_manager', 'performance_monitor', 'auth_service', 'cachecolor', 'widget')
+_EXTRAS = ('Color(0xFF112233)', 'Color(0xFFAABBCC)', 'Color(0xFF445566)', 'OnBoarding', 'ONBOARD', 'filler ')
+
+def _classify(name: str) -> set:
+    """Categories of a file name by plain substring tests, as the validator did before the classifier regex"""
+    categories = {c for c in ('theme', 'color', 'typography', 'cache', 'performance', 'auth') if c in name}
+    if name.startswith('premium_'):
+        categories.add('premium')
+    return categories
+
+class _ReferenceValidator(IndustrialUXValidator):
+    """Reads every file whole, tests each token with `in` and never touches the cache"""
+    def _scan_tags(self, content: bytes) -> int:
+        tags = sum(_TAG_BITS[token] for token in _CONTENT_TOKENS if token in content)
+        return tags | self._derived_tags(content, tags)
+
+    def _load_cache(self):
+        return {}
+
+    def _save_cache(self):
+        pass
+
+def _write_project(root: str, rng: random.Random):
+    """A small project whose files mix tokens, sometimes well past _PEEK_SIZE or across the peek boundary"""
+    tokens = [token.decode('latin-1') for token in _CONTENT_TOKENS] + list(_EXTRAS)
+    lib = os.path.join(root, 'lib')
+    os.makedirs(lib)
+    for i in range(rng.randint(1, 10)):
+        parts = rng.sample(tokens, rng.randint(0, 8))
+        if rng.random() < 0.4:
+            parts.insert(rng.randint(0, len(parts)), 'x' * rng.randint(_PEEK_SIZE // 2, _PEEK_SIZE * 3))
+        content = rng.choice((' ', '\n')).join(parts)
+        if rng.random() < 0.3:
+            # Put a token across the end of the peek, so only the overlap window can find it
+            token = rng.choice(tokens)
+            content = 'y' * (_PEEK_SIZE - rng.randint(1, len(token))) + token + content
+        name = rng.choice(_NAMES) + ('_%d' % i if rng.random() < 0.5 else '') + '.dart'
+        with open(os.path.join(lib, name), 'w') as f:
+            f.write(content)
+    if rng.random() < 0.5:
+        with open(os.path.join(root, 'pubspec.yaml'), 'w') as f:
+            f.write('name: app\n' + ('flutter:\n  fonts:\n' if rng.random() < 0.5 else ''))
+
+def _run(validator: IndustrialUXValidator) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return validator.validate_complete_ux()
+
+class UXValidatorTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def _reference(self):
+        with mock.patch.object(ux, '_PEEK_SIZE', 1 << 40):
+            return _run(_ReferenceValidator(self.root))
+
+    def _check_backend(self, make_validator):
+        for seed in range(25):
+            with self.subTest(seed=seed):
+                shutil.rmtree(self.root)
+                os.makedirs(self.root)
+                rng = random.Random(seed)
+                _write_project(self.root, rng)
+                expected = self._reference()
+                self.assertEqual(_run(make_validator()), expected)
+
+                # The second run answers from the tag cache
+                validator = make_validator()
+                self.assertEqual(_run(validator), expected)
+                self.assertFalse(validator._cache_dirty)
+
+                # Editing a file invalidates just that file's cache entry
+                path = os.path.join(self.root, 'lib', rng.choice(os.listdir(os.path.join(self.root, 'lib'))))
+                with open(path, 'a') as f:
+                    f.write(' ' + rng.choice(_CONTENT_TOKENS).decode('latin-1'))
+                self.assertEqual(_run(make_validator()), self._reference())
+
+    @unittest.skipIf(ux.ahocorasick is None, "pyahocorasick is not installed")
+    def test_aho_corasick_scan(self):
+        self._check_backend(lambda: IndustrialUXValidator(self.root))
+
+    def test_generated_scan(self):
+        def make_validator():
+            validator = IndustrialUXValidator(self.root)
+            validator._automaton = None
+            return validator
+        self._check_backend(make_validator)
+
+    @unittest.skipIf(importlib.util.find_spec('numba') is None, "numba is not installed")
+    def test_numba_scan(self):
+        def make_validator():
+            validator = IndustrialUXValidator(self.root)
+            validator._automaton = None
+            return validator
+        with mock.patch.object(ux, '_KERNEL_MIN_BYTES', -1):
+            self._check_backend(make_validator)
+
+    def test_file_name_buckets(self):
+        lib = os.path.join(self.root, 'lib')
+        os.makedirs(lib)
+        for name in _NAMES + ('premium_', 'xpremium_theme', 'themecolorcacheauth'):
+            open(os.path.join(lib, name + '.dart'), 'w').close()
+        validator = IndustrialUXValidator(self.root)
+        _run(validator)
+        buckets = {
+            'theme': validator._theme_files,
+            'color': validator._color_files,
+            'typography': validator._typography_files,
+            'cache': validator._cache_files,
+            'performance': validator._perf_files,
+            'auth': validator._auth_files,
+            'premium': validator._premium_components
+        }
+        for entry in os.scandir(lib):
+            with self.subTest(entry.name):
+                self.assertEqual({category for category, paths in buckets.items() if entry.path in paths},
+                                 _classify(entry.name))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the candidate-line scanner in validate_dart.py
+Run from Flutter_App with: python3 -m unittest
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from validate_dart import DartValidator, _MMAP_THRESHOLD
+
+# (label, Dart source) pairs aimed at line numbering and at the edges of _CANDIDATE_RE
+_CASES = (
+    ('empty', b''),
+    ('valid file', b"import 'package:a/b.dart';\n\nclass Foo {\n  final x = 1;\n}\n"),
+    ('bad imports', b"import foo bar;\nimport 'a.dart'\nimport   'b.dart';\n"),
+    ('missing semicolons', b'var x = 1\nx = y\nfinal z = {\na = b,\nif (a) x = 1\nreturn a ==b\n'),
+    ('brace runs', b'{{{\n}}}\n{ } {\n  {{ }\n'),
+    ('comments', b'// x = 1\n// {{{\n  // import foo\n'),
+    ('crlf', b'var x = 1\r\n{{{\r\nimport foo;\r\n'),
+    ('lone cr', b'var x = 1\r{{{\rimport foo;\r'),
+    ('mixed breaks', b'a = 1\n\rb = 2\r\n\nc = 3\r\rd = 4'),
+    ('no trailing newline', b'final y = 2'),
+    ('only whitespace after =', b'x = \nx =\t\n'),
+    ('vertical tab and form feed', b'x =\x0b1\ny =\x0c2\n\x0b{{{\x0c\n'),
+    ('= before ; or {', b'x = a; b = c\ny = {\nz = f(a) {\n'),
+    ('several candidates per line', b'x = 1 {{{ }}} import y\n'),
+    ('non-ascii', b'x = "\xc3\xa9"\nimport \xc3\xa9;\n'),
+    ('widget without build', b'class Baz extends StatelessWidget {\n}\n'),
+    ('widget with build', b'class Baz extends StatefulWidget {\n  Widget build(BuildContext context) {}\n}\n'),
+)
+
+_ATOMS = (b'import ', b"'a/b.dart'", b';', b'{', b'}', b'=', b' ', b'\t', b'\x0b', b'\x0c', b'\r', b'\n', b'\r\n',
+          b'x', b'if', b'=>', b',', b'//', b'\xc3\xa9', b'class Foo', b'extends StatelessWidget',
+          b'Widget build(BuildContext context)')
+
+def _fresh_results():
+    return {'syntax_errors': [], 'import_errors': [], 'structure_issues': [], 'warnings': []}
+
+def _reference(validator: DartValidator, file_str: str, content: bytes):
+    """Issues from checking every line in turn, as the validator did before the candidate regex"""
+    results = _fresh_results()
+    for i, line in enumerate(content.splitlines(), 1):
+        validator._check_line(file_str, i, line.strip(), results)
+    validator._check_structure(file_str, content, results)
+    return results
+
+def _scanned(validator: DartValidator, file_str: str, content: bytes):
+    results = _fresh_results()
+    validator._validate_dart_file(file_str, content, results)
+    return results
+
+class CandidateScanTest(unittest.TestCase):
+    def setUp(self):
+        self.validator = DartValidator('.')
+
+    def test_cases(self):
+        for label, content in _CASES:
+            with self.subTest(label):
+                self.assertEqual(_scanned(self.validator, 'foo.dart', content),
+                                 _reference(self.validator, 'foo.dart', content))
+
+    def test_random_fragments(self):
+        rng = random.Random(0)
+        for n in range(2000):
+            content = b''.join(rng.choices(_ATOMS, k=rng.randint(0, 40)))
+            with self.subTest(n=n, content=content):
+                self.assertEqual(_scanned(self.validator, 'foo.dart', content),
+                                 _reference(self.validator, 'foo.dart', content))
+
+    def test_mapped_file(self):
+        # Files above _MMAP_THRESHOLD are scanned through an mmap rather than bytes
+        rng = random.Random(1)
+        content = b''.join(rng.choices(_ATOMS, k=40000))
+        self.assertGreater(len(content), _MMAP_THRESHOLD)
+        with tempfile.TemporaryDirectory() as root:
+            file_str = os.path.join(root, 'foo.dart')
+            with open(file_str, 'wb') as f:
+                f.write(content)
+            self.assertEqual(self.validator._validate_isolated(file_str),
+                             _reference(self.validator, file_str, content))
+
+if __name__ == '__main__':
+    unittest.main()
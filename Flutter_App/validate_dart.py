@@ -4,15 +4,62 @@ Dart Code Validation Script
 Validates Dart code syntax, imports, and structure without Flutter SDK
 """
 
+import argparse
+import mmap
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+# Sources are checked as bytes, so \w only matches ASCII word characters, as in Dart identifiers
+_ASSIGN_RE = re.compile(rb'\w+\s*=\s*[^;{]+$')
+_IMPORT_RE = re.compile(rb"import\s+['\"][\w/:.]+['\"];?")
+_CLASS_RE = re.compile(rb'class\s+(\w+)')
+_CONTROL_WORDS = (b'if', b'for', b'while', b'switch', b'try', b'=>')
+_CAMEL_RE = re.compile('(.)([A-Z][a-z]+)')
+
+# Lines that can fail a line check: an import, two braces, or an '=' whose right-hand side runs to the
+# end of the line without ';' or '{'. Every match stays inside one line; other lines are never looked at
+_CANDIDATE_RE = re.compile(rb'import |[{}][^\r\n]*[{}]|=[ \t\x0b\x0c]*[^;{\s][^;{\r\n]*(?=[\r\n]|\Z)')
+_LINE_BREAK_RE = re.compile(rb'\r\n|\r|\n')
+
+# Files above this size are mapped rather than read; below it the mmap setup costs more than the copy
+_MMAP_THRESHOLD = 64 * 1024
+
+# Directories skipped during discovery: build output, tool caches and native platform projects
+_PRUNE_DIRS = frozenset({'build', '.dart_tool', '.git', '.idea', 'ios', 'android', '.pub-cache', 'node_modules'})
+_GENERATED_SUFFIXES = ('.g.dart', '.freezed.dart')
+
+def _iter_dart_files(root: str, rel: str = '', exclude_dirs=_PRUNE_DIRS, include_generated: bool = False):
+    """Yield root-relative paths of Dart files as they are found, without descending into excluded directories"""
+    try:
+        it = os.scandir(os.path.join(root, rel))
+    except OSError:
+        # Unreadable or vanished directories are skipped, as rglob and os.walk do
+        return
+    with it:
+        for entry in it:
+            path = os.path.join(rel, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude_dirs:
+                    yield from _iter_dart_files(root, path, exclude_dirs, include_generated)
+            elif entry.name.endswith('.dart'):
+                if include_generated or not entry.name.endswith(_GENERATED_SUFFIXES):
+                    yield path
+
+# Default for --jobs; time goes to file reads, which run outside the GIL
+_MAX_WORKERS = 8
+
 class DartValidator:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, jobs: int = _MAX_WORKERS, exclude_dirs=_PRUNE_DIRS,
+                 include_generated: bool = False):
         self.project_root = Path(project_root)
+        self.exclude_dirs = frozenset(exclude_dirs)
+        self.include_generated = include_generated
+        self.jobs = jobs
         self.errors = []
         self.warnings = []
         self.files_checked = 0
@@ -21,10 +68,6 @@ class DartValidator:
         """Validate entire Dart project"""
         print("🔍 Starting Dart project validation...")
         
-        # Find all Dart files
-        dart_files = list(self.project_root.rglob("*.dart"))
-        print(f"📁 Found {len(dart_files)} Dart files to validate")
-        
         results = {
             'files_checked': 0,
             'syntax_errors': [],
@@ -34,117 +77,160 @@ class DartValidator:
             'summary': {}
         }
         
-        for dart_file in dart_files:
-            self._validate_dart_file(dart_file, results)
-            results['files_checked'] += 1
+        # Files are validated as the walk finds them, with a bounded number in flight.
+        # Each worker fills its own lists; merging in file order keeps the report deterministic
+        # Report paths the way Path would join them: relative to '.', otherwise prefixed with the root
+        root = str(self.project_root)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for rel in _iter_dart_files(root, '', self.exclude_dirs, self.include_generated):
+                file_str = rel if root == '.' else os.path.join(root, rel)
+                pending.append(pool.submit(self._validate_isolated, file_str))
+                if len(pending) >= self.jobs * 4:
+                    self._merge(results, pending.popleft().result())
+            while pending:
+                self._merge(results, pending.popleft().result())
+        print(f"📁 Validated {results['files_checked']} Dart files")
             
         self._generate_summary(results)
         return results
     
-    def _validate_dart_file(self, file_path: Path, results: Dict):
-        """Validate individual Dart file"""
+    def _merge(self, results: Dict, file_results: Dict[str, List]):
+        """Append one file's issues to the project results"""
+        for key, issues in file_results.items():
+            results[key].extend(issues)
+        results['files_checked'] += 1
+    
+    def _validate_isolated(self, file_str: str) -> Dict[str, List]:
+        """Read and validate one file into fresh issue lists, so workers never share state"""
+        file_results = {
+            'syntax_errors': [],
+            'import_errors': [],
+            'structure_issues': [],
+            'warnings': []
+        }
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Basic syntax validation
-            self._check_syntax(file_path, content, results)
-            
-            # Import validation
-            self._check_imports(file_path, content, results)
-            
-            # Structure validation
-            self._check_structure(file_path, content, results)
+            with open(file_str, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        self._validate_dart_file(file_str, content, file_results)
+                else:
+                    self._validate_dart_file(file_str, f.read(), file_results)
             
-        except Exception as e:
-            results['syntax_errors'].append({
-                'file': str(file_path),
+        except (OSError, UnicodeDecodeError) as e:
+            file_results['syntax_errors'].append({
+                'file': file_str,
                 'error': f"Failed to read file: {str(e)}"
             })
+        return file_results
     
-    def _check_syntax(self, file_path: Path, content: str, results: Dict):
-        """Basic Dart syntax validation"""
-        lines = content.split('\n')
+    def _validate_dart_file(self, file_str: str, content, results: Dict):
+        """Run the line checks on the lines the candidate regex finds, then the structure checks.
+        content is bytes or an mmap, so only regexes, find() and slicing are used on it"""
+        # Line numbers follow bytes.splitlines(): \n, \r\n and \r each end a line.
+        # An mmap has no count(), so the regex walks the mapping in place instead of copying each gap out
+        if isinstance(content, bytes):
+            def count_breaks(start: int, end: int) -> int:
+                return (content.count(b'\n', start, end) + content.count(b'\r', start, end)
+                        - content.count(b'\r\n', start, end))
+        else:
+            def count_breaks(start: int, end: int) -> int:
+                return sum(1 for _ in _LINE_BREAK_RE.finditer(content, start, end))
         
-        for i, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line or line.startswith('//'):
+        line_no = 1
+        pos = 0
+        last_line = 0
+        for match in _CANDIDATE_RE.finditer(content):
+            start = match.start()
+            line_no += count_breaks(pos, start)
+            pos = start
+            if line_no == last_line:
                 continue
-                
-            # Check for unmatched braces
-            if line.count('{') != line.count('}'):
-                open_braces = line.count('{') - line.count('}')
-                if abs(open_braces) > 1:  # Allow single brace mismatch per line
-                    results['syntax_errors'].append({
-                        'file': str(file_path),
-                        'line': i,
-                        'error': f"Potential brace mismatch: {line[:50]}..."
-                    })
+            last_line = line_no
             
-            # Check for semicolon issues (basic check)
-            if (line.endswith('}') or line.endswith(';')) and '=' in line and not line.startswith('//'):
-                continue  # Likely valid
-            elif (re.search(r'\w+\s*=\s*[^;{]+$', line) and 
-                  not line.endswith(',') and 
-                  not any(x in line for x in ['if', 'for', 'while', 'switch', 'try', '=>'])):
-                results['syntax_errors'].append({
-                    'file': str(file_path),
+            line_start = max(content.rfind(b'\n', 0, start), content.rfind(b'\r', 0, start)) + 1
+            line_end = len(content)
+            for line_break in (b'\n', b'\r'):
+                found = content.find(line_break, start, line_end)
+                if found >= 0:
+                    line_end = found
+            self._check_line(file_str, line_no, content[line_start:line_end].strip(), results)
+        
+        # Structure validation
+        self._check_structure(file_str, content, results)
+    
+    def _check_line(self, file_str: str, i: int, line: bytes, results: Dict):
+        """Import and syntax checks for one stripped line"""
+        # Check import format
+        if line.startswith(b'import '):
+            # Basic import format validation
+            if not _IMPORT_RE.match(line):
+                results['import_errors'].append({
+                    'file': file_str,
                     'line': i,
-                    'error': f"Missing semicolon: {line[:50]}..."
+                    'error': f"Invalid import format: {line.decode('utf-8', 'replace')}"
+                })
+            
+            # Check for missing semicolon in imports
+            if not line.endswith(b';'):
+                results['import_errors'].append({
+                    'file': file_str,
+                    'line': i,
+                    'error': f"Missing semicolon in import: {line.decode('utf-8', 'replace')}"
                 })
-    
-    def _check_imports(self, file_path: Path, content: str, results: Dict):
-        """Validate import statements"""
-        lines = content.split('\n')
         
-        for i, line in enumerate(lines, 1):
-            line = line.strip()
+        if not line or line.startswith(b'//'):
+            return
             
-            # Check import format
-            if line.startswith('import '):
-                # Basic import format validation
-                if not re.match(r"import\s+['\"][\w/:.]+['\"];?", line):
-                    results['import_errors'].append({
-                        'file': str(file_path),
-                        'line': i,
-                        'error': f"Invalid import format: {line}"
-                    })
-                
-                # Check for missing semicolon in imports
-                if not line.endswith(';'):
-                    results['import_errors'].append({
-                        'file': str(file_path),
-                        'line': i,
-                        'error': f"Missing semicolon in import: {line}"
-                    })
-    
-    def _check_structure(self, file_path: Path, content: str, results: Dict):
+        # Check for unmatched braces
+        open_braces = line.count(b'{') - line.count(b'}')
+        if abs(open_braces) > 1:  # Allow single brace mismatch per line
+            results['syntax_errors'].append({
+                'file': file_str,
+                'line': i,
+                'error': f"Potential brace mismatch: {line.decode('utf-8', 'replace')[:50]}..."
+            })
+        
+        # Check for semicolon issues (basic check)
+        if (line.endswith(b'}') or line.endswith(b';')) and b'=' in line:
+            return  # Likely valid
+        elif (_ASSIGN_RE.search(line) and 
+              not line.endswith(b',') and 
+              not any(x in line for x in _CONTROL_WORDS)):
+            results['syntax_errors'].append({
+                'file': file_str,
+                'line': i,
+                'error': f"Missing semicolon: {line.decode('utf-8', 'replace')[:50]}..."
+            })
+    
+    def _check_structure(self, file_str: str, content, results: Dict):
         """Check code structure and patterns"""
         # Check for class definitions
-        class_matches = re.findall(r'class\s+(\w+)', content)
+        class_matches = _CLASS_RE.findall(content)
         
         # Check if file name matches class name (convention)
-        file_name = file_path.stem
+        file_name = os.path.splitext(os.path.basename(file_str))[0]
         if class_matches and len(class_matches) == 1:
-            class_name = class_matches[0]
+            class_name = class_matches[0].decode('ascii')
             expected_filename = self._camel_to_snake(class_name)
             if file_name != expected_filename and not file_name.endswith('_test'):
                 results['warnings'].append({
-                    'file': str(file_path),
+                    'file': file_str,
                     'warning': f"File name '{file_name}' doesn't match class '{class_name}' (expected: {expected_filename})"
                 })
         
         # Check for proper widget structure
-        if 'extends StatelessWidget' in content or 'extends StatefulWidget' in content:
-            if 'Widget build(BuildContext context)' not in content:
+        # find() rather than `in`: on an mmap, `in` tests for a single byte, not a substring
+        if content.find(b'extends StatelessWidget') >= 0 or content.find(b'extends StatefulWidget') >= 0:
+            if content.find(b'Widget build(BuildContext context)') < 0:
                 results['structure_issues'].append({
-                    'file': str(file_path),
+                    'file': file_str,
                     'error': "Widget missing build method"
                 })
     
     def _camel_to_snake(self, name: str) -> str:
         """Convert CamelCase to snake_case"""
-        return re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name).lower()
+        return _CAMEL_RE.sub(r'\1_\2', name).lower()
     
     def _generate_summary(self, results: Dict):
         """Generate validation summary"""
@@ -163,16 +249,20 @@ class DartValidator:
         }
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 validate_dart.py <flutter_project_path>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Validate Dart code syntax, imports, and structure")
+    parser.add_argument('project_path', help="Flutter project path")
+    parser.add_argument('--jobs', '-j', type=int, default=_MAX_WORKERS,
+                        help=f"number of files validated concurrently (default: {_MAX_WORKERS})")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error(f"--jobs must be at least 1, got {args.jobs}")
     
-    project_path = sys.argv[1]
+    project_path = args.project_path
     if not os.path.exists(project_path):
         print(f"Error: Project path '{project_path}' does not exist")
         sys.exit(1)
     
-    validator = DartValidator(project_path)
+    validator = DartValidator(project_path, jobs=args.jobs)
     results = validator.validate_project()
     
     # Print results